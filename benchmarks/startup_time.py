@@ -0,0 +1,28 @@
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+#measures cold start of the app in fresh interpreters, run from the project root with: python -m benchmarks.startup_time
+
+def time_fresh_import(import_statement: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", import_statement], check=True)
+    return time.perf_counter() - start
+
+def benchmark_import(label: str, import_statement: str, rounds: int):
+    timings = [time_fresh_import(import_statement) for _ in range(rounds)]
+    print(f"{label}: median {statistics.median(timings) * 1000:.0f} ms, min {min(timings) * 1000:.0f} ms over {rounds} runs")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark app import time")
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    benchmark_import("bare interpreter", "pass", args.rounds) #baseline cost of starting python itself
+    benchmark_import("import main", "import main", args.rounds) #what every worker and test process pays on startup
+    benchmark_import("import main + engines", "import main, pymupdf, pytesseract, pdf2image, PIL.Image, unidecode, ollama", args.rounds) #roughly what startup cost when the engines were imported eagerly
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,4 +1,8 @@
 import os
 
 UPLOAD_DIR = "bucket" #define upload directory called bucket to store uploaded files
-os.makedirs(UPLOAD_DIR, exist_ok=True) #if bucket does not exist, create bucket
\ No newline at end of file
+
+OCR_BACKEND = os.getenv("OCR_BACKEND", "auto") #auto uses the in-process tesserocr engine when installed and falls back to pytesseract, can also be set to tesserocr or pytesseract
+
+def create_upload_dir():
+    os.makedirs(UPLOAD_DIR, exist_ok=True) #if bucket does not exist, create bucket (called from the app lifespan instead of on import)
\ No newline at end of file
@@ -1,5 +1,8 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File, HTTPException, Header
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel import Session, select
+import asyncio
 import os
 from hashlib import sha256
 from database.models import Intake, IntakeCreate, Client, ChecklistItem, Document
@@ -11,6 +14,7 @@ from constants import CLIENT_COMPLEXITY_CHECKLIST
 from logic.extraction import extract_document_fields 
 from config import UPLOAD_DIR
 from logic.status import mark_checklist_item_received, mark_intake_received, mark_checklist_item_extracted, mark_intake_extracted
+from logic.events import intake_event_broker, format_server_sent_event, RESYNC
 
 router = APIRouter(prefix="/intakes", tags=["Intakes"])
 
@@ -224,4 +228,73 @@ def get_intake_checklist(intake_id: UUID):
                 }
                 for checklist_item in intake_checklist
             ]
-        }
\ No newline at end of file
+        }
+
+EVENT_STREAM_HEARTBEAT_SECONDS = 15 #comment line sent on idle streams so proxies do not close them
+
+def get_intake_snapshot(intake_id: UUID) -> dict | None: #read only version of the checklist response, used as the first event of a stream and after a resync
+    with Session(engine) as session:
+        intake = session.get(Intake, intake_id)
+        if not intake:
+            return None
+        intake_checklist = session.exec(
+            select(ChecklistItem).where(ChecklistItem.intake_id == intake.id).order_by(ChecklistItem.created_at)
+        ).all()
+        return {
+            "intake": {
+                "id": intake.id,
+                "status": intake.status,
+            },
+            "intake_checklist": [
+                {
+                    "checklist_item": {
+                        "id": checklist_item.id,
+                        "doc_kind": checklist_item.doc_kind,
+                        "status": checklist_item.status,
+                        "created_at": checklist_item.created_at
+                    }
+                }
+                for checklist_item in intake_checklist
+            ]
+        }
+
+@router.get("/{intake_id}/events", status_code=200) #GET endpoint that streams checklist item and intake status changes as Server-Sent Events instead of polling the checklist
+async def stream_intake_events(intake_id: UUID, last_event_id: str | None = Header(default=None)): #browsers send the Last-Event-ID header automatically when they reconnect
+    try:
+        last_seen_event_id = int(last_event_id) if last_event_id else None
+    except ValueError: #unknown id format so treat it like a fresh connection
+        last_seen_event_id = None
+
+    subscriber, missed_events, snapshot_event_id = intake_event_broker.subscribe(intake_id, last_seen_event_id) #subscribe before reading the snapshot so no transition can slip in between
+    intake_snapshot = await run_in_threadpool(get_intake_snapshot, intake_id)
+    if not intake_snapshot:
+        intake_event_broker.unsubscribe(intake_id, subscriber)
+        raise HTTPException(status_code=404, detail="Intake not found")
+
+    async def event_stream():
+        try:
+            yield "retry: 3000\n\n" #tells the browser how long to wait before reconnecting
+            if missed_events is None: #first connection (or too much was missed) so start from the current state
+                yield format_server_sent_event(snapshot_event_id, "snapshot", intake_snapshot)
+            else:
+                for intake_event in missed_events:
+                    yield format_server_sent_event(intake_event["id"], intake_event["type"], intake_event["data"])
+
+            queue = subscriber[1]
+            while True:
+                try:
+                    intake_event = await asyncio.wait_for(queue.get(), timeout=EVENT_STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                if intake_event is RESYNC:
+                    resync_event_id = intake_event_broker.last_event_id
+                    resync_snapshot = await run_in_threadpool(get_intake_snapshot, intake_id)
+                    if resync_snapshot:
+                        yield format_server_sent_event(resync_event_id, "snapshot", resync_snapshot)
+                    continue
+                yield format_server_sent_event(intake_event["id"], intake_event["type"], intake_event["data"])
+        finally: #client disconnected (or server shutting down) so stop delivering to this queue
+            intake_event_broker.unsubscribe(intake_id, subscriber)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
\ No newline at end of file
@@ -1,10 +1,7 @@
-from unidecode import unidecode
-from PIL import Image
-import pymupdf
-import pytesseract
 from database.models import Document
 from enums import DocumentDocKindEnum 
 from constants import RECEIPT_KEYWORDS, T4_KEYWORDS, ID_KEYWORDS
+from logic.ocr import ocr_image_to_string
 
 def classify_document(document: Document) -> DocumentDocKindEnum: #master function to classify documents
     document_classification = classify_document_by_name(document) #first try classifying by name
@@ -22,13 +19,15 @@ def classify_document_by_contents(document: Document) -> DocumentDocKindEnum: #c
 
     document_contents = ""
     try:
+        from PIL import Image #heavy engines are imported on first use so importing the app stays fast
+        import pymupdf
         if document_stored_path.lower().endswith(".pdf"): #if file is a pdf or PDF then use PyMyPDF to get text from file
             with pymupdf.open(document_stored_path) as pdf_file: #use with..as to close file afterwards automatically
                 for page in pdf_file: #for each page in pdf file, get page text and add to contents
                     document_contents += page.get_text("text")
-        elif document_stored_path.lower().endswith((".png", ".jpg", ".jpeg")): #if file is an image then use pytesseract OCR (optical character recognition) to convert image to string and add to contents
+        elif document_stored_path.lower().endswith((".png", ".jpg", ".jpeg")): #if file is an image then use OCR (optical character recognition) to convert image to string and add to contents
             with Image.open(document_stored_path) as image_file:
-                document_contents = pytesseract.image_to_string(image_file)
+                document_contents = ocr_image_to_string(image_file)
     except Exception as e: #triggers if an Exception occurs inside try
         print(f"{document.filename} could not be processed: {e}")
 
@@ -47,5 +46,6 @@ def search_keywords_in_text(text: str) -> DocumentDocKindEnum:
         return DocumentDocKindEnum.unknown #returns unknown if no keywords are found
     
 def normalize_text(text: str) -> str:
+    from unidecode import unidecode
     compacted_lowercased_unicoded_text = unidecode(text).lower().replace(" ", "").replace("\n", "") #normalize text for matching by removing non-ASCII characters, converting to lowercase and remove spaces and newlines for matching
     return compacted_lowercased_unicoded_text
\ No newline at end of file
@@ -0,0 +1,115 @@
+import asyncio
+import itertools
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from uuid import UUID
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+EVENT_HISTORY_SIZE = 100 #recent events kept per intake so reconnecting clients can replay what they missed
+MAX_INTAKE_HISTORIES = 10000 #least recently used intake histories are dropped past this (their clients get a fresh snapshot instead)
+SUBSCRIBER_QUEUE_SIZE = 100 #a subscriber that falls this far behind is sent a snapshot instead of every missed event
+RESYNC = {"type": "resync"} #queued in place of events when a subscriber overflows its queue
+
+class IntakeHistory:
+    def __init__(self, history_start: int):
+        self.events = deque()
+        self.history_start = history_start #every event for the intake with an id >= history_start is still in events
+
+class IntakeEventBroker: #in-process pub/sub for intake status transitions, idle subscribers are just an asyncio queue each (no polling, no database work)
+    def __init__(self):
+        self.lock = threading.Lock() #publish is called from sync endpoint threads while subscribers live on the event loop
+        self.event_ids = itertools.count(int(time.time() * 1000)) #time based start so ids keep increasing across restarts and stale Last-Event-IDs trigger a snapshot
+        self.last_event_id = next(self.event_ids)
+        self.histories = OrderedDict()
+        self.subscribers = {}
+
+    def get_history(self, intake_id: UUID) -> IntakeHistory: #must be called with lock held
+        history = self.histories.get(intake_id)
+        if history is None:
+            history = IntakeHistory(self.last_event_id + 1)
+            self.histories[intake_id] = history
+            if len(self.histories) > MAX_INTAKE_HISTORIES:
+                self.histories.popitem(last=False)
+        else:
+            self.histories.move_to_end(intake_id)
+        return history
+
+    def publish(self, intake_id: UUID, event_type: str, data: dict) -> dict:
+        with self.lock:
+            self.last_event_id = next(self.event_ids)
+            intake_event = {"id": self.last_event_id, "type": event_type, "data": data}
+            history = self.get_history(intake_id)
+            history.events.append(intake_event)
+            if len(history.events) > EVENT_HISTORY_SIZE:
+                history.history_start = history.events.popleft()["id"] + 1
+            subscribers = list(self.subscribers.get(intake_id, ()))
+
+        for loop, queue in subscribers: #hand the event to each subscriber's own event loop
+            try:
+                loop.call_soon_threadsafe(deliver_event, queue, intake_event)
+            except RuntimeError: #loop already closed, the subscriber is gone
+                self.unsubscribe(intake_id, (loop, queue))
+        return intake_event
+
+    def subscribe(self, intake_id: UUID, last_event_id: int | None) -> tuple:
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE))
+        with self.lock:
+            history = self.get_history(intake_id)
+            if last_event_id is not None and last_event_id >= history.history_start - 1: #nothing was dropped since the client's last event so replay the rest
+                missed_events = [intake_event for intake_event in history.events if intake_event["id"] > last_event_id]
+            else:
+                missed_events = None #no usable Last-Event-ID so the caller has to send a snapshot
+            self.subscribers.setdefault(intake_id, set()).add(subscriber)
+            snapshot_event_id = self.last_event_id
+        return subscriber, missed_events, snapshot_event_id
+
+    def unsubscribe(self, intake_id: UUID, subscriber: tuple):
+        with self.lock:
+            intake_subscribers = self.subscribers.get(intake_id)
+            if intake_subscribers:
+                intake_subscribers.discard(subscriber)
+                if not intake_subscribers:
+                    del self.subscribers[intake_id]
+
+def deliver_event(queue: asyncio.Queue, intake_event: dict): #runs on the subscriber's event loop
+    try:
+        queue.put_nowait(intake_event)
+    except asyncio.QueueFull: #slow client, drop the backlog and tell it to resync from a snapshot
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(RESYNC)
+
+intake_event_broker = IntakeEventBroker()
+
+def format_server_sent_event(event_id: int, event_type: str, data: dict) -> str:
+    return f"id: {event_id}\nevent: {event_type}\ndata: {json.dumps(data, default=str)}\n\n"
+
+def queue_status_event(session: Session, intake_id: UUID, event_type: str, entity_id: UUID, previous_status, new_status, data: dict):
+    #status changes are held on the session and only published after commit, so subscribers never see a transition that was rolled back
+    pending_events = session.info.setdefault("pending_status_events", {})
+    event_key = (event_type, entity_id)
+    if event_key in pending_events: #same row changed twice in one transaction (e.g. done -> received -> done), keep the original previous status
+        pending_events[event_key]["status"] = new_status
+    else:
+        pending_events[event_key] = {"intake_id": intake_id, "event_type": event_type, "previous_status": previous_status, "status": new_status, "data": data}
+
+@event.listens_for(Session, "after_commit")
+def publish_pending_status_events(session: Session):
+    pending_events = session.info.pop("pending_status_events", None)
+    if not pending_events:
+        return
+    for pending_event in pending_events.values():
+        if pending_event["previous_status"] == pending_event["status"]: #net no-op within the transaction
+            continue
+        intake_event_broker.publish(pending_event["intake_id"], pending_event["event_type"], {
+            **pending_event["data"],
+            "previous_status": pending_event["previous_status"],
+            "status": pending_event["status"],
+        })
+
+@event.listens_for(Session, "after_rollback")
+def discard_pending_status_events(session: Session):
+    session.info.pop("pending_status_events", None)
\ No newline at end of file
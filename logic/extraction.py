@@ -1,9 +1,6 @@
 from database.models import Document
-from pdf2image import convert_from_path
-import pytesseract
-from PIL import Image
 from enums import DocumentDocKindEnum
-from ollama import generate
+from logic.ocr import ocr_image_to_string
 import json
 import re
 
@@ -18,12 +15,14 @@ def extract_document_contents(document: Document) -> str:
     document_stored_path = document.stored_path
     document_contents = ""
     try:
+        from PIL import Image #heavy engines are imported on first use so importing the app stays fast
+        from pdf2image import convert_from_path
         if document_stored_path.lower().endswith(".pdf"): #convert pdf to image because for some reason image OCR is better than getting text from pdf
             pdf_image = convert_from_path(document_stored_path, dpi=300) #dpi is dots per inch and is basically like resolution
-            document_contents = pytesseract.image_to_string(pdf_image[0]) #only convert the first page of the pdf (t4) because second page has too much info (overwhelms model)
+            document_contents = ocr_image_to_string(pdf_image[0]) #only convert the first page of the pdf (t4) because second page has too much info (overwhelms model)
         elif document_stored_path.lower().endswith((".png", ".jpg", ".jpeg")): 
             with Image.open(document_stored_path) as image_file:
-                document_contents = pytesseract.image_to_string(image_file)
+                document_contents = ocr_image_to_string(image_file)
     except Exception as e: 
         print(f"{document.filename} could not be processed: {e}")
 
@@ -93,6 +92,7 @@ def select_extraction_prompt(document: Document, document_contents: str) -> str:
 def run_extraction_model(extraction_prompt: str) -> dict | None:
     model = "gemma3" #model that will be used to extract fields
     try: 
+        from ollama import generate #ollama client is only loaded once a document is actually extracted
         model_output = generate(model=model, prompt=extraction_prompt) #generate model output with model and prompt
         response = model_output['response'] #get the response part of the model output
         extracted_fields = None
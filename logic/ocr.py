@@ -0,0 +1,70 @@
+import atexit
+import threading
+from typing import TYPE_CHECKING
+from config import OCR_BACKEND
+
+if TYPE_CHECKING: #PIL is only needed for type hints here, the engines themselves are imported lazily
+    from PIL import Image
+
+class PytesseractOCREngine: #fallback OCR engine, pytesseract writes the image to a temp file and forks a new tesseract process (which reloads the language models) for every call
+    name = "pytesseract"
+
+    def image_to_string(self, image: "Image.Image") -> str:
+        import pytesseract
+        return pytesseract.image_to_string(image)
+
+    def close(self):
+        pass #nothing to release since every call is its own process
+
+class TesserocrOCREngine: #persistent in-process OCR engine, the tesseract API handle (and its loaded language models) is created once and reused for every call
+    name = "tesserocr"
+
+    def __init__(self, language: str = "eng"):
+        import tesserocr #optional dependency so only import it when this engine is actually requested
+        self.api = tesserocr.PyTessBaseAPI(lang=language)
+
+    def image_to_string(self, image: "Image.Image") -> str:
+        self.api.SetImage(image) #hands the PIL image straight to tesseract in memory, no temp files
+        return self.api.GetUTF8Text()
+
+    def close(self):
+        self.api.End()
+
+OCR_ENGINES = { #available OCR backends, OCR_BACKEND in config.py picks one of these (or auto)
+    "tesserocr": TesserocrOCREngine,
+    "pytesseract": PytesseractOCREngine,
+}
+
+thread_local_engines = threading.local() #a tesseract API handle is not thread safe so each worker thread gets its own engine
+created_engines = []
+created_engines_lock = threading.Lock()
+
+def create_ocr_engine(backend: str = OCR_BACKEND):
+    if backend == "auto": #prefer the persistent engine and fall back to pytesseract if tesserocr is not installed or cannot load the models
+        try:
+            return TesserocrOCREngine()
+        except Exception as e:
+            print(f"tesserocr unavailable, falling back to pytesseract: {e}")
+            return PytesseractOCREngine()
+    if backend not in OCR_ENGINES:
+        raise ValueError(f"Unknown OCR backend {backend} (expected auto, {', '.join(OCR_ENGINES)})")
+    return OCR_ENGINES[backend]()
+
+def get_ocr_engine():
+    engine = getattr(thread_local_engines, "engine", None)
+    if engine is None: #first OCR call on this thread so create the engine and keep it for every later call
+        engine = create_ocr_engine()
+        thread_local_engines.engine = engine
+        with created_engines_lock:
+            created_engines.append(engine)
+    return engine
+
+def ocr_image_to_string(image: "Image.Image") -> str: #single entry point used by classification and extraction
+    return get_ocr_engine().image_to_string(image)
+
+@atexit.register
+def close_ocr_engines(): #release the API handles (and their models) when the process exits
+    with created_engines_lock:
+        for engine in created_engines:
+            engine.close()
+        created_engines.clear()
@@ -2,6 +2,7 @@ from enums import DocumentDocKindEnum, ChecklistItemStatusEnum, IntakeStatusEnum
 from uuid import UUID
 from sqlmodel import Session, select
 from database.models import ChecklistItem, Intake
+from logic.events import queue_status_event
 
 def mark_checklist_item_received(document_classification: DocumentDocKindEnum, intake_id: UUID, session: Session):
     if document_classification == DocumentDocKindEnum.unknown: #only look for missing checklist item if we have successfully classified the current document
@@ -16,8 +17,7 @@ def mark_checklist_item_received(document_classification: DocumentDocKindEnum, i
         .order_by(ChecklistItem.created_at)
     ).first()
     if matching_missing_checklist_item: #if missing item exists, we have just received it so mark status as received
-        matching_missing_checklist_item.status = ChecklistItemStatusEnum.received
-        session.add(matching_missing_checklist_item)
+        set_checklist_item_status(matching_missing_checklist_item, ChecklistItemStatusEnum.received, session)
 
 def mark_intake_received(intake_id: UUID, session: Session):
     intake_checklist = session.exec( #fetch intake checklist items
@@ -26,8 +26,7 @@ def mark_intake_received(intake_id: UUID, session: Session):
     ).all()
     if all(item.status in [ChecklistItemStatusEnum.received, ChecklistItemStatusEnum.extracted]for item in intake_checklist): #if all intake items are received then intake should be done
         intake = session.get(Intake, intake_id)
-        intake.status = IntakeStatusEnum.received
-        session.add(intake)
+        set_intake_status(intake, IntakeStatusEnum.received, session)
 
 def mark_checklist_item_extracted(extracted_fields: dict | None, document_classification: DocumentDocKindEnum, intake_id: UUID, session: Session):
         if extracted_fields == None:
@@ -42,8 +41,7 @@ def mark_checklist_item_extracted(extracted_fields: dict | None, document_classi
             .order_by(ChecklistItem.created_at)
         ).first()
         if matching_received_checklist_item:
-            matching_received_checklist_item.status = ChecklistItemStatusEnum.extracted
-            session.add(matching_received_checklist_item)
+            set_checklist_item_status(matching_received_checklist_item, ChecklistItemStatusEnum.extracted, session)
 def mark_intake_extracted(intake_id: UUID, session: Session):
     intake_checklist = session.exec( #fetch intake checklist items
         select(ChecklistItem).where(ChecklistItem.intake_id == intake_id).order_by(ChecklistItem.created_at)
@@ -51,5 +49,20 @@ def mark_intake_extracted(intake_id: UUID, session: Session):
     ).all()
     if all(item.status == ChecklistItemStatusEnum.extracted for item in intake_checklist): #if all intake items are received then intake should be done
         intake = session.get(Intake, intake_id)
-        intake.status = IntakeStatusEnum.done
-        session.add(intake)
\ No newline at end of file
+        set_intake_status(intake, IntakeStatusEnum.done, session)
+
+def set_checklist_item_status(checklist_item: ChecklistItem, status: ChecklistItemStatusEnum, session: Session): #every checklist item transition goes through here so it can be streamed to /intakes/{intake_id}/events
+    queue_status_event(session, checklist_item.intake_id, "checklist_item_status", checklist_item.id, checklist_item.status, status, {
+        "intake_id": checklist_item.intake_id,
+        "checklist_item_id": checklist_item.id,
+        "doc_kind": checklist_item.doc_kind,
+    })
+    checklist_item.status = status
+    session.add(checklist_item)
+
+def set_intake_status(intake: Intake, status: IntakeStatusEnum, session: Session):
+    queue_status_event(session, intake.id, "intake_status", intake.id, intake.status, status, {
+        "intake_id": intake.id,
+    })
+    intake.status = status
+    session.add(intake)
\ No newline at end of file
@@ -1,12 +1,19 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from database.database import create_database_tables
+from config import create_upload_dir
 from endpoints import clients, intakes, documents
 
-create_database_tables() #call function to create database tables 
+@asynccontextmanager
+async def lifespan(app: FastAPI): #runs once when the server starts instead of as an import side effect, so importing main stays cheap
+    create_database_tables() #call function to create database tables
+    create_upload_dir()
+    yield
 
 app = FastAPI( #creates new FastAPI app instance
     title="RPG-Mini: Accounting Automation", #title shown in docs
     description="Developed by Nathan Au", #description shown in docs
+    lifespan=lifespan,
 )
 
 app.include_router(clients.router) #include routers from endpoints
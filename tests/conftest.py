@@ -0,0 +1,8 @@
+import pytest
+from fastapi.testclient import TestClient
+from main import app
+
+@pytest.fixture(scope="session", autouse=True)
+def app_lifespan():
+    with TestClient(app): #entering a TestClient runs the app lifespan (database tables and upload directory) once for the whole test session
+        yield
\ No newline at end of file
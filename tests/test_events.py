@@ -0,0 +1,54 @@
+from fastapi.testclient import TestClient
+from main import app
+
+client = TestClient(app)
+
+def read_first_event(intake_id: str, headers: dict = {}) -> dict: #reads the first event off the stream and then disconnects
+    with client.stream("GET", f"/intakes/{intake_id}/events", headers=headers) as events_response:
+        assert events_response.status_code == 200
+        assert events_response.headers["content-type"].startswith("text/event-stream")
+        server_sent_event = {}
+        for line in events_response.iter_lines():
+            if line.startswith(("id:", "event:", "data:")):
+                field, value = line.split(":", 1)
+                server_sent_event[field] = value.strip()
+            elif line == "" and "event" in server_sent_event:
+                return server_sent_event
+
+def test_intake_events_404():
+    events_response = client.get("/intakes/00000000-0000-0000-0000-000000000000/events")
+    assert events_response.status_code == 404
+    assert events_response.json()["detail"] == "Intake not found"
+
+def test_intake_events_replay():
+    test_client_data = {
+        "name": "Test Client",
+        "email": "testclient@example.com",
+        "complexity": "simple"
+    }
+    client_response = client.post("/clients/", json=test_client_data)
+    test_client_id = client_response.json()["id"]
+
+    intake_response = client.post("/intakes/", json={"client_id": test_client_id, "fiscal_year": 2025})
+    test_intake_id = intake_response.json()["intake"]["id"]
+
+    #first connection gets the current state as a snapshot
+    snapshot_event = read_first_event(test_intake_id)
+    assert snapshot_event["event"] == "snapshot"
+    assert '"status": "open"' in snapshot_event["data"]
+
+    #upload and classify t4 by filename while disconnected
+    with open("./tests/sample_docs/T4_sample.pdf", "rb") as f:
+        files = {"file": ("T4_sample.pdf", f, "application/pdf")}
+        document_upload_response = client.post(f"/intakes/{test_intake_id}/documents", files=files)
+    test_document_id = document_upload_response.json()["id"]
+    classification_response = client.post(f"/documents/{test_document_id}/classify")
+    assert classification_response.status_code == 200
+
+    #reconnecting with Last-Event-ID replays the checklist transition that was missed
+    replayed_event = read_first_event(test_intake_id, headers={"Last-Event-ID": snapshot_event["id"]})
+    assert replayed_event["event"] == "checklist_item_status"
+    assert int(replayed_event["id"]) > int(snapshot_event["id"])
+    assert '"doc_kind": "T4"' in replayed_event["data"]
+    assert '"previous_status": "missing"' in replayed_event["data"]
+    assert '"status": "received"' in replayed_event["data"]
\ No newline at end of file
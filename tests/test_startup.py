@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+import json
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ["pymupdf", "fitz", "pytesseract", "tesserocr", "pdf2image", "PIL", "unidecode", "ollama"] #OCR/PDF/LLM engines that should only load on first use
+
+def import_main_in_subprocess(working_dir) -> dict: #import main in a fresh interpreter so modules already loaded by other tests do not count
+    import_script = (
+        "import sys, json, time\n"
+        "start = time.perf_counter()\n"
+        "import main\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(json.dumps({{'elapsed': elapsed, 'loaded': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", import_script],
+        cwd=working_dir,
+        env={**os.environ, "PYTHONPATH": PROJECT_ROOT},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def test_import_main_skips_heavy_engines(tmp_path):
+    import_result = import_main_in_subprocess(tmp_path)
+    assert import_result["loaded"] == [] #none of the engines should be pulled in by importing the app
+
+def test_import_main_has_no_side_effects(tmp_path):
+    import_main_in_subprocess(tmp_path)
+    assert not (tmp_path / "database.db").exists() #schema creation happens in the lifespan, not on import
+    assert not (tmp_path / "bucket").exists()
\ No newline at end of file